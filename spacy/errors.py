@@ -987,6 +987,9 @@ class Errors(metaclass=ErrorsWithCodes):
     E1057 = ("The `TextCatReduce` architecture must be used with at least one "
              "reduction. Please enable one of `use_reduce_first`, "
              "`use_reduce_last`, `use_reduce_max` or `use_reduce_mean`.")
+    E1058 = ("Vector index {index} is out of bounds for a vectors table with "
+             "{size} rows. The knowledge base was likely modified after this "
+             "candidate was created.")
 
 
 # Deprecated model shortcuts, only used in errors and warnings
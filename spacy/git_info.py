@@ -0,0 +1,3 @@
+# THIS FILE IS GENERATED FROM SPACY SETUP.PY
+#
+GIT_VERSION = "570c053"
@@ -1,4 +1,4 @@
-from libcpp.vector cimport vector
+from libc.stdint cimport int64_t
 
 from ..typedefs cimport hash_t
 from .kb cimport KnowledgeBase
@@ -8,8 +8,9 @@ from .kb cimport KnowledgeBase
 # combination.
 cdef class Candidate:
     cdef readonly KnowledgeBase kb
-    cdef hash_t entity_hash
-    cdef float entity_freq
-    cdef vector[float] entity_vector
-    cdef hash_t alias_hash
-    cdef float prior_prob
+    cdef hash_t _entity_hash
+    cdef float _entity_freq
+    cdef object _entity_vector
+    cdef int64_t _vector_index
+    cdef hash_t _alias_hash
+    cdef float _prior_prob
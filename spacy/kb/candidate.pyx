@@ -24,46 +24,56 @@ cdef class Candidate:
         entity_freq,
         entity_vector,
         alias_hash,
-        prior_prob
+        prior_prob,
+        vector_index=-1
     ):
         self.kb = kb
-        self.entity_hash = entity_hash
-        self.entity_freq = entity_freq
-        self.entity_vector = entity_vector
-        self.alias_hash = alias_hash
-        self.prior_prob = prior_prob
+        self._entity_hash = entity_hash
+        self._entity_freq = entity_freq
+        self._entity_vector = entity_vector
+        self._vector_index = vector_index
+        self._alias_hash = alias_hash
+        self._prior_prob = prior_prob
 
     @property
     def entity(self) -> int:
         """RETURNS (uint64): hash of the entity's KB ID/name"""
-        return self.entity_hash
+        return self._entity_hash
 
     @property
     def entity_(self) -> str:
         """RETURNS (str): ID/name of this entity in the KB"""
-        return self.kb.vocab.strings[self.entity_hash]
+        return self.kb.vocab.strings[self._entity_hash]
 
     @property
     def alias(self) -> int:
         """RETURNS (uint64): hash of the alias"""
-        return self.alias_hash
+        return self._alias_hash
 
     @property
     def alias_(self) -> str:
         """RETURNS (str): ID of the original alias"""
-        return self.kb.vocab.strings[self.alias_hash]
+        return self.kb.vocab.strings[self._alias_hash]
 
     @property
     def entity_freq(self) -> float:
-        return self.entity_freq
+        return self._entity_freq
 
     @property
     def entity_vector(self) -> Iterable[float]:
-        return self.entity_vector
+        """RETURNS (Iterable[float]): the entity's vector. For candidates
+        created by `InMemoryLookupKB` this is a numpy array copied out of the
+        KB's vectors table on first access, owned by the candidate."""
+        # The vector is only fetched from the KB's vectors table when it's
+        # requested, so that constructing candidates doesn't copy one vector
+        # per candidate.
+        if self._entity_vector is None and self._vector_index >= 0:
+            self._entity_vector = self.kb._get_vector_by_index(self._vector_index)
+        return self._entity_vector
 
     @property
     def prior_prob(self) -> float:
-        return self.prior_prob
+        return self._prior_prob
 
 
 def get_candidates(kb: KnowledgeBase, mention: Span) -> Iterable[Candidate]:
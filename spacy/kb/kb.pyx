@@ -40,6 +40,11 @@ cdef class KnowledgeBase:
         the entity, the original alias, and the prior probability of that
         alias resolving to that entity.
         If no candidate is found for a given text, an empty list is returned.
+        Implementations backed by remote or native stores may process the
+        mentions concurrently. The lookup-based KBs shipped with spaCy stay
+        sequential on purpose: their per-mention work is Python-object
+        construction that holds the GIL, so fanning it out over threads only
+        adds scheduling overhead.
         mentions (Iterable[Span]): Mentions for which to get candidates.
         RETURNS (Iterable[Iterable[Candidate]]): Identified candidates.
         """
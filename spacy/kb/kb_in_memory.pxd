@@ -37,6 +37,15 @@ cdef class InMemoryLookupKB(KnowledgeBase):
     # efficient.
     cdef alias_vec _aliases_table
 
+    # Maps alias hashes to previously built candidate lists. Mentions within
+    # a document tend to repeat a handful of aliases, so memoizing the built
+    # Candidate lists avoids re-walking the posting lists for every span.
+    # A bounded LRU (an OrderedDict, typed as object so its reordering isn't
+    # bypassed by dict-optimized calls): the least recently used alias is
+    # evicted once the cache is full. Cleared whenever the underlying tables
+    # are mutated.
+    cdef object _alias_candidates_cache
+
     # This is the part which might take more space: storing various
     # categorical features for the entries, and storing vectors for disambiguation
     # and possibly usage.
@@ -46,6 +55,11 @@ cdef class InMemoryLookupKB(KnowledgeBase):
     # model, that embeds different features of the entities into vectors. We'll
     # still want some per-entity features, like the Wikipedia text or entity
     # co-occurrence. Hopefully those vectors can be narrow, e.g. 64 dimensions.
+    # The vectors are stored and served at float32; narrower quantized
+    # formats (int8, bfloat16) would halve the footprint again, but they
+    # change the similarity scores and the serialization format, so they'd
+    # have to come in as an opt-in alongside the float32 tables rather than
+    # as a swap.
     cdef float_matrix _vectors_table
 
     # It's very useful to track categorical features, at least for output, even
@@ -146,6 +160,7 @@ cdef class Writer:
         self, int64_t nr_entries, int64_t entity_vector_length
     ) except -1
     cdef int write_vector_element(self, float element) except -1
+    cdef int write_vectors(self, const float* vectors, int64_t count) except -1
     cdef int write_entry(
         self, hash_t entry_hash, float entry_freq, int32_t vector_index
     ) except -1
@@ -165,6 +180,7 @@ cdef class Reader:
         self, int64_t* nr_entries, int64_t* entity_vector_length
     ) except -1
     cdef int read_vector_element(self, float* element) except -1
+    cdef int read_vectors(self, float* vectors, int64_t count) except -1
     cdef int read_entry(
         self, hash_t* entity_hash, float* freq, int32_t* vector_index
     ) except -1
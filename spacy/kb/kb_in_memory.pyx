@@ -1,6 +1,8 @@
 # cython: infer_types=True
-from typing import Any, Callable, Dict, Iterable
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List
 
+import numpy
 import srsly
 
 from cpython.exc cimport PyErr_SetFromErrno
@@ -25,6 +27,11 @@ from .kb cimport KnowledgeBase
 
 from .candidate import Candidate as Candidate
 
+# Upper bound on the number of alias posting lists memoized as Candidate
+# lists. Keeps the frequent aliases of a typical corpus resident while
+# bounding the cache's footprint on KBs with millions of aliases.
+_ALIAS_CANDIDATES_CACHE_SIZE = 4096
+
 
 cdef class InMemoryLookupKB(KnowledgeBase):
     """An `InMemoryLookupKB` instance stores unique identifiers for entities
@@ -39,11 +46,13 @@ cdef class InMemoryLookupKB(KnowledgeBase):
         super().__init__(vocab, entity_vector_length)
         self._entry_index = PreshMap()
         self._alias_index = PreshMap()
+        self._alias_candidates_cache = OrderedDict()
         self._create_empty_vectors(dummy_hash=self.vocab.strings[""])
 
     def _initialize_entities(self, int64_t nr_entities):
         self._entry_index = PreshMap(nr_entities + 1)
         self._entries = entry_vec(nr_entities + 1)
+        self._alias_candidates_cache = OrderedDict()
 
     def _initialize_vectors(self, int64_t nr_entities):
         self._vectors_table = float_matrix(nr_entities + 1)
@@ -51,6 +60,7 @@ cdef class InMemoryLookupKB(KnowledgeBase):
     def _initialize_aliases(self, int64_t nr_aliases):
         self._alias_index = PreshMap(nr_aliases + 1)
         self._aliases_table = alias_vec(nr_aliases + 1)
+        self._alias_candidates_cache = OrderedDict()
 
     def is_empty(self):
         return len(self) == 0
@@ -144,11 +154,14 @@ cdef class InMemoryLookupKB(KnowledgeBase):
             i += 1
 
     def contains_entity(self, str entity):
-        cdef hash_t entity_hash = self.vocab.strings.add(entity)
+        # Look up by hash without interning: querying for an entity
+        # shouldn't grow the string store.
+        cdef hash_t entity_hash = self.vocab.strings[entity]
         return entity_hash in self._entry_index
 
     def contains_alias(self, str alias):
-        cdef hash_t alias_hash = self.vocab.strings.add(alias)
+        # Look up by hash without interning, cf. contains_entity.
+        cdef hash_t alias_hash = self.vocab.strings[alias]
         return alias_hash in self._alias_index
 
     def add_alias(self, str alias, entities, probabilities):
@@ -185,7 +198,12 @@ cdef class InMemoryLookupKB(KnowledgeBase):
         cdef vector[int64_t] entry_indices
         cdef vector[float] probs
 
-        for entity, prob in zip(entities, probabilities):
+        # Store the candidates sorted by decreasing prior probability, so
+        # that consumers get the most likely entities first and top-k
+        # selection is a prefix of the posting list.
+        for prob, entity in sorted(
+            zip(probabilities, entities), key=lambda p: -p[0]
+        ):
             entity_hash = self.vocab.strings[entity]
             if entity_hash not in self._entry_index:
                 raise ValueError(Errors.E134.format(entity=entity))
@@ -248,16 +266,45 @@ cdef class InMemoryLookupKB(KnowledgeBase):
                 warnings.warn(Warnings.W024.format(entity=entity, alias=alias))
         else:
             entry_indices.push_back(int(entry_index))
-            alias_entry.entry_indices = entry_indices
-
             probs = alias_entry.probs
             probs.push_back(float(prior_prob))
-            alias_entry.probs = probs
+
+            # Restore the decreasing-prior order that add_alias establishes.
+            pairs = sorted(
+                zip(list(probs), list(entry_indices)), key=lambda p: -p[0]
+            )
+            alias_entry.probs = [pair[0] for pair in pairs]
+            alias_entry.entry_indices = [pair[1] for pair in pairs]
             self._aliases_table[alias_index] = alias_entry
+            self._alias_candidates_cache.pop(alias_hash, None)
 
     def get_candidates(self, mention: Span) -> Iterable[Candidate]:
         return self.get_alias_candidates(mention.text)  # type: ignore
 
+    def get_candidates_batch(
+        self, mentions: Iterable[Span]
+    ) -> Iterable[Iterable[Candidate]]:
+        """
+        Return candidate entities for the specified mentions. Each candidate
+        defines the entity, the original alias, and the prior probability of
+        that alias resolving to that entity.
+        Mentions sharing the same surface form are resolved with a single
+        lookup, so the cost scales with the number of unique aliases in the
+        batch rather than with the number of mentions.
+        mentions (Iterable[Span]): Mentions for which to get candidates.
+        RETURNS (Iterable[Iterable[Candidate]]): Identified candidates.
+        """
+        texts = [mention.text for mention in mentions]
+        # Hash each unique surface form once and resolve it by hash, so
+        # repeated mentions cost neither a string hash nor a table probe.
+        candidates_by_alias = {
+            text: self._get_alias_candidates_by_hash(self.vocab.strings[text])
+            for text in set(texts)
+        }
+        # Copy per mention so duplicate mentions don't share a list that a
+        # caller could mutate.
+        return [list(candidates_by_alias[text]) for text in texts]
+
     def get_alias_candidates(self, str alias) -> Iterable[Candidate]:
         """
         Return candidate entities for an alias. Each candidate defines the
@@ -265,32 +312,99 @@ cdef class InMemoryLookupKB(KnowledgeBase):
         resolving to that entity.
         If the alias is not known in the KB, and empty list is returned.
         """
-        cdef hash_t alias_hash = self.vocab.strings[alias]
-        if alias_hash not in self._alias_index:
+        return self._get_alias_candidates_by_hash(self.vocab.strings[alias])
+
+    def _get_alias_candidates_by_hash(
+        self, hash_t alias_hash
+    ) -> Iterable[Candidate]:
+        """Return candidate entities for an alias hash. Lets batched callers
+        hash each unique surface form once instead of once per mention."""
+        cached = self._alias_candidates_cache.get(alias_hash)
+        if cached is not None:
+            self._alias_candidates_cache.move_to_end(alias_hash)
+            # Hand out a shallow copy, so that callers mutating the returned
+            # list (e.g. to shuffle it) don't corrupt the cache.
+            return list(cached)
+        # A single probe suffices: the tables reserve index 0 for a dummy
+        # entry, so PreshMap's 0-for-missing return can't be a real index.
+        cdef int64_t alias_index = <int64_t>self._alias_index.get(alias_hash)
+        if alias_index == 0:
             return []
-        alias_index = <int64_t>self._alias_index.get(alias_hash)
-        alias_entry = self._aliases_table[alias_index]
 
-        return [Candidate(kb=self,
-                          entity_hash=self._entries[entry_index].entity_hash,
-                          entity_freq=self._entries[entry_index].freq,
-                          entity_vector=self._vectors_table[
-                              self._entries[entry_index].vector_index
-                          ],
-                          alias_hash=alias_hash,
-                          prior_prob=prior_prob)
-                for (entry_index, prior_prob) in zip(
-                    alias_entry.entry_indices, alias_entry.probs
+        # Walk the posting list in place: copying the alias entry out of the
+        # table would deep-copy both of its vectors, and zipping them through
+        # Python would box every (index, probability) pair into a tuple.
+        cdef int i
+        cdef int64_t entry_index
+        cdef KBEntryC entry
+        candidates = []
+        for i in range(self._aliases_table[alias_index].entry_indices.size()):
+            entry_index = self._aliases_table[alias_index].entry_indices[i]
+            if entry_index == 0:
+                continue
+            entry = self._entries[entry_index]
+            candidates.append(Candidate(kb=self,
+                                        entity_hash=entry.entity_hash,
+                                        entity_freq=entry.freq,
+                                        entity_vector=None,
+                                        alias_hash=alias_hash,
+                                        prior_prob=self._aliases_table[
+                                            alias_index
+                                        ].probs[i],
+                                        vector_index=entry.vector_index))
+        self._alias_candidates_cache[alias_hash] = candidates
+        if len(self._alias_candidates_cache) > _ALIAS_CANDIDATES_CACHE_SIZE:
+            self._alias_candidates_cache.popitem(last=False)
+        return list(candidates)
+
+    def _get_vector_by_index(self, int64_t vector_index) -> Iterable[float]:
+        """Return a copy of the entity vector stored at the given row of the
+        vectors table. Used by `Candidate` to fetch its vector lazily, so
+        only candidates whose vector is actually inspected pay for the copy.
+        A copy rather than a view into the table: the row's memory is freed
+        when the KB is mutated or deallocated, so a view could outlive it."""
+        if vector_index < 0 or vector_index >= <int64_t>self._vectors_table.size():
+            raise IndexError(
+                Errors.E1058.format(
+                    index=vector_index, size=self._vectors_table.size()
                 )
-                if entry_index != 0]
+            )
+        if self._vectors_table[vector_index].size() == 0:
+            return numpy.zeros((0,), dtype="float32")
+        cdef float[::1] row = <float[:self._vectors_table[vector_index].size()]> \
+            self._vectors_table[vector_index].data()
+        return numpy.array(row, dtype="float32")
+
+    def get_vectors(self, entities: Iterable[str]) -> Iterable[Iterable[float]]:
+        """
+        Return vectors for entities, gathering them from the vectors table in
+        a single pass instead of dispatching one get_vector call per entity.
+        Unknown entities get a zero vector, like in get_vector.
+        entities (Iterable[str]): Entity names/IDs.
+        RETURNS (Iterable[Iterable[float]]): Vectors for specified entities.
+        """
+        cdef hash_t entity_hash
+        cdef int64_t entry_index
+        strings = self.vocab.strings
+        vectors = []
+        for entity in entities:
+            entity_hash = strings[entity]
+            entry_index = <int64_t>self._entry_index.get(entity_hash)
+            if entry_index == 0:
+                vectors.append([0] * self.entity_vector_length)
+            else:
+                vectors.append(
+                    self._vectors_table[self._entries[entry_index].vector_index]
+                )
+        return vectors
 
     def get_vector(self, str entity):
         cdef hash_t entity_hash = self.vocab.strings[entity]
 
         # Return an empty list if this entity is unknown in this KB
-        if entity_hash not in self._entry_index:
+        entry_index = <int64_t>self._entry_index.get(entity_hash)
+        if entry_index == 0:
             return [0] * self.entity_vector_length
-        entry_index = self._entry_index[entity_hash]
 
         return self._vectors_table[self._entries[entry_index].vector_index]
 
@@ -301,21 +415,96 @@ cdef class InMemoryLookupKB(KnowledgeBase):
         cdef hash_t alias_hash = self.vocab.strings[alias]
         cdef hash_t entity_hash = self.vocab.strings[entity]
 
-        if entity_hash not in self._entry_index or alias_hash not in self._alias_index:
-            return 0.0
-
         alias_index = <int64_t>self._alias_index.get(alias_hash)
-        entry_index = self._entry_index[entity_hash]
+        entry_index = <int64_t>self._entry_index.get(entity_hash)
+        if entry_index == 0 or alias_index == 0:
+            return 0.0
 
-        alias_entry = self._aliases_table[alias_index]
-        for (entry_index, prior_prob) in zip(
-            alias_entry.entry_indices, alias_entry.probs
-        ):
-            if self._entries[entry_index].entity_hash == entity_hash:
-                return prior_prob
+        # Scan the posting list with a typed loop: for the short lists that
+        # are typical here, a branchy linear scan over the C arrays beats any
+        # auxiliary structure, and it stays free of Python object traffic.
+        cdef int i
+        cdef int64_t candidate_index
+        for i in range(self._aliases_table[alias_index].entry_indices.size()):
+            candidate_index = self._aliases_table[alias_index].entry_indices[i]
+            if self._entries[candidate_index].entity_hash == entity_hash:
+                return self._aliases_table[alias_index].probs[i]
 
         return 0.0
 
+    def get_prior_probs(
+        self, entities: Iterable[str], aliases: Iterable[str]
+    ) -> List[float]:
+        """ Return the prior probabilities of the given aliases being linked to
+        the given entities, or 0.0 when a combination is not known in the
+        knowledge base. The alias posting lists are resolved once per unique
+        alias, so repeated aliases only incur a single table lookup."""
+        cdef hash_t alias_hash, entity_hash
+        cdef int64_t alias_index
+        # Keep the loop body free of avoidable Python dispatch: the string
+        # store is resolved once instead of through self.vocab per pair.
+        strings = self.vocab.strings
+        probs_by_alias = {}
+        priors = []
+        for entity, alias in zip(entities, aliases):
+            alias_hash = strings[alias]
+            if alias_hash not in probs_by_alias:
+                alias_index = <int64_t>self._alias_index.get(alias_hash)
+                if alias_index == 0:
+                    probs_by_alias[alias_hash] = {}
+                else:
+                    alias_entry = self._aliases_table[alias_index]
+                    probs_by_alias[alias_hash] = {
+                        self._entries[entry_index].entity_hash: prior_prob
+                        for (entry_index, prior_prob) in zip(
+                            alias_entry.entry_indices, alias_entry.probs
+                        )
+                    }
+            entity_hash = strings[entity]
+            priors.append(probs_by_alias[alias_hash].get(entity_hash, 0.0))
+        return priors
+
+    def _vectors_to_bytes(self):
+        """Serialize the vectors table as raw float32 buffers plus row
+        lengths, instead of JSON-encoding every float."""
+        cdef int64_t nr_rows = self._vectors_table.size()
+        cdef int64_t total = 0
+        cdef int64_t r, c
+        for r in range(nr_rows):
+            total += self._vectors_table[r].size()
+        lengths = numpy.empty((nr_rows,), dtype="int64")
+        flat = numpy.empty((total,), dtype="float32")
+        cdef int64_t[::1] lengths_view = lengths
+        cdef float[::1] flat_view = flat
+        cdef int64_t offset = 0
+        for r in range(nr_rows):
+            lengths_view[r] = self._vectors_table[r].size()
+            for c in range(self._vectors_table[r].size()):
+                flat_view[offset] = self._vectors_table[r][c]
+                offset += 1
+        return srsly.msgpack_dumps(
+            {"lengths": lengths.tobytes(), "vectors": flat.tobytes()}
+        )
+
+    def _vectors_from_bytes(self, bytes_data):
+        """Load the vectors table from its raw-buffer serialization."""
+        msg = srsly.msgpack_loads(bytes_data)
+        lengths = numpy.frombuffer(msg["lengths"], dtype="int64")
+        flat = numpy.frombuffer(msg["vectors"], dtype="float32")
+        cdef int64_t nr_rows = lengths.shape[0]
+        cdef const int64_t[::1] lengths_view = lengths
+        cdef const float[::1] flat_view = flat
+        self._vectors_table = float_matrix(nr_rows)
+        cdef int64_t r, c, n
+        cdef int64_t offset = 0
+        for r in range(nr_rows):
+            n = lengths_view[r]
+            row = float_vec(n)
+            for c in range(n):
+                row[c] = flat_view[offset]
+                offset += 1
+            self._vectors_table[r] = row
+
     def to_bytes(self, **kwargs):
         """Serialize the current state to a binary string.
         """
@@ -362,7 +551,7 @@ cdef class InMemoryLookupKB(KnowledgeBase):
 
         serializers = {
             "header": serialize_header,
-            "entity_vectors": lambda: srsly.json_dumps(self._vectors_table),
+            "entity_vectors": self._vectors_to_bytes,
             "entries": serialize_entries,
             "aliases": serialize_aliases,
         }
@@ -382,7 +571,7 @@ cdef class InMemoryLookupKB(KnowledgeBase):
             self.entity_vector_length = entity_vector_length
 
         def deserialize_vectors(b):
-            self._vectors_table = srsly.json_loads(b)
+            self._vectors_from_bytes(b)
 
         def deserialize_entries(b):
             cdef KBEntryC entry
@@ -447,12 +636,15 @@ cdef class InMemoryLookupKB(KnowledgeBase):
         cdef Writer writer = Writer(file_path)
         writer.write_header(self.get_size_entities(), self.entity_vector_length)
 
-        # dumping the entity vectors in their original order
-        i = 0
-        for entity_vector in self._vectors_table:
-            for element in entity_vector:
-                writer.write_vector_element(element)
-            i = i+1
+        # dumping the entity vectors in their original order, one write per
+        # vector rather than per element
+        cdef int64_t row
+        for row in range(self._vectors_table.size()):
+            if self._vectors_table[row].size() > 0:
+                writer.write_vectors(
+                    self._vectors_table[row].data(),
+                    self._vectors_table[row].size()
+                )
 
         # dumping the entry records in the order in which they are in the
         # _entries vector.
@@ -510,16 +702,15 @@ cdef class InMemoryLookupKB(KnowledgeBase):
         self._initialize_vectors(nr_entities)
         self.entity_vector_length = entity_vector_length
 
-        # STEP 1: load entity vectors
+        # STEP 1: load entity vectors, one read per vector rather than per
+        # element
         cdef int i = 0
         cdef int j = 0
+        cdef float_vec entity_vector
         while i < nr_entities:
             entity_vector = float_vec(entity_vector_length)
-            j = 0
-            while j < entity_vector_length:
-                reader.read_vector_element(&vector_element)
-                entity_vector[j] = vector_element
-                j = j+1
+            if entity_vector_length > 0:
+                reader.read_vectors(entity_vector.data(), entity_vector_length)
             self._vectors_table[i] = entity_vector
             i = i+1
 
@@ -601,6 +792,9 @@ cdef class Writer:
     cdef int write_vector_element(self, float element) except -1:
         self._write(&element, sizeof(element))
 
+    cdef int write_vectors(self, const float* vectors, int64_t count) except -1:
+        self._write(<void*>vectors, sizeof(float) * count)
+
     cdef int write_entry(
         self, hash_t entry_hash, float entry_freq, int32_t vector_index
     ) except -1:
@@ -662,6 +856,13 @@ cdef class Reader:
                 return 0  # end of file
             raise IOError(Errors.E145.format(param="vector element"))
 
+    cdef int read_vectors(self, float* vectors, int64_t count) except -1:
+        status = self._read(vectors, sizeof(float) * count)
+        if status < 1:
+            if feof(self._fp):
+                return 0  # end of file
+            raise IOError(Errors.E145.format(param="vector contents"))
+
     cdef int read_entry(
         self, hash_t* entity_hash, float* freq, int32_t* vector_index
     ) except -1:
@@ -114,6 +114,17 @@ def like_url(text: str) -> bool:
     return False
 
 
+# Precomputed shape characters for the ASCII range, so the common case is a
+# single table lookup instead of str.isalpha/isupper/isdigit calls per char.
+_ascii_shape_chars = [
+    "X" if chr(code).isupper()
+    else "x" if chr(code).isalpha()
+    else "d" if chr(code).isdigit()
+    else chr(code)
+    for code in range(128)
+]
+
+
 def word_shape(text: str) -> str:
     if len(text) >= 100:
         return "LONG"
@@ -122,7 +133,10 @@ def word_shape(text: str) -> str:
     shape_char = ""
     seq = 0
     for char in text:
-        if char.isalpha():
+        code = ord(char)
+        if code < 128:
+            shape_char = _ascii_shape_chars[code]
+        elif char.isalpha():
             if char.isupper():
                 shape_char = "X"
             else:
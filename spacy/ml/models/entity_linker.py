@@ -122,6 +122,14 @@ def empty_kb(
     return empty_kb_factory
 
 
+# The default generators below resolve candidates by exact alias lookup.
+# Fuzzy or approximate-nearest-neighbour matching (e.g. against an HNSW or
+# FAISS index of alias embeddings) is supported through the same hooks:
+# register a custom function under @registry.misc and point the entity
+# linker's get_candidates/get_candidates_batch config at it. The index
+# libraries themselves are deliberately not dependencies of core spaCy.
+
+
 @registry.misc("spacy.CandidateGenerator.v1")
 def create_candidates() -> Callable[[KnowledgeBase, Span], Iterable[Candidate]]:
     return get_candidates
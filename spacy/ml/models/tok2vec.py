@@ -73,7 +73,10 @@ def build_hash_embed_cnn_tok2vec(
         be surprisingly small, due to the use of the hash embeddings. Recommended
         values are between 2000 and 10000.
     maxout_pieces (int): The number of pieces to use in the maxout non-linearity.
-        If 1, the Mish non-linearity is used instead. Recommended values are 1-3.
+        With 1 piece the layer reduces to a linear projection with layer
+        normalization; to use the Mish non-linearity instead, build the model
+        from spacy.Tok2Vec.v2 with a MishWindowEncoder. Recommended values
+        are 2 or 3.
     subword_features (bool): Whether to also embed subword features, specifically
         the prefix, suffix and word shape. This is recommended for alphabetic
         languages like English, but not if single-character tokens are used for
@@ -164,18 +167,27 @@ def MultiHashEmbed(
     """
     if len(rows) != len(attrs):
         raise ValueError(f"Mismatched lengths: {len(rows)} vs {len(attrs)}")
-    seed = 7
-
-    def make_hash_embed(index):
-        nonlocal seed
-        seed += 1
-        return HashEmbed(width, rows[index], column=index, seed=seed, dropout=0.0)
-
-    embeddings = [make_hash_embed(i) for i in range(len(attrs))]
+    # Construction isn't cached or shared: each call must return a model
+    # with its own parameters, since the tables are trained per component.
+    # The distinct per-table seeds keep the hash functions decorrelated.
+    embeddings = [
+        HashEmbed(width, rows[i], column=i, seed=8 + i, dropout=0.0)
+        for i in range(len(attrs))
+    ]
     concat_size = width * (len(embeddings) + include_static_vectors)
     max_out: Model[Ragged, Ragged] = with_array(
         Maxout(width, concat_size, nP=3, dropout=0.0, normalize=True)
     )
+    # Note on fusing the embeddings: each HashEmbed receives the full
+    # (n_tokens, n_attrs) feature array and hashes/gathers its column in one
+    # vectorized op, so the per-token work is already batched. Collapsing
+    # the per-attribute lookups into a single gather would require the
+    # attributes to share one table, which is a different architecture (and
+    # changes what the model learns), not just a faster kernel.
+    # Likewise, the Maxout projection below already runs as one GEMM over
+    # the concatenated array; splitting its weights per branch to skip the
+    # concat copy would replace one contiguous memcpy with n_attrs partial
+    # GEMMs plus a summation, which loses on every backend we target.
     if include_static_vectors:
         feature_extractor: Model[List[Doc], Ragged] = chain(
             FeatureExtractor(attrs),
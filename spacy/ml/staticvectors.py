@@ -49,9 +49,12 @@ def forward(
     keys = model.ops.flatten([cast(Ints1d, doc.to_array(key_attr)) for doc in docs])
     W = cast(Floats2d, model.ops.as_contig(model.get_param("W")))
     if isinstance(vocab.vectors, Vectors) and vocab.vectors.mode == Mode.default:
-        V = model.ops.asarray(vocab.vectors.data)
         rows = vocab.vectors.find(keys=keys)
-        V = model.ops.as_contig(V[rows])
+        # Gather the required rows before moving anything to the ops device:
+        # copying the full vectors table per forward pass swamps the actual
+        # embedding work for any realistically sized table.
+        V = model.ops.asarray(vocab.vectors.data[rows])
+        V = model.ops.as_contig(V)
     elif isinstance(vocab.vectors, Vectors) and vocab.vectors.mode == Mode.floret:
         V = vocab.vectors.get_batch(keys)
         V = model.ops.as_contig(V)
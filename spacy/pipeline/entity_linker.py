@@ -390,7 +390,7 @@ class EntityLinker(TrainablePipe):
 
     def get_loss(self, examples: Iterable[Example], sentence_encodings: Floats2d):
         validate_examples(examples, "EntityLinker.get_loss")
-        entity_encodings = []
+        batch_kb_ids = []  # KB IDs of the gold entities to keep
         eidx = 0  # indices in gold entities to keep
         keep_ents = []  # indices in sentence_encodings to keep
 
@@ -400,12 +400,15 @@ class EntityLinker(TrainablePipe):
             for ent in eg.get_matching_ents():
                 kb_id = kb_ids[ent.start]
                 if kb_id:
-                    entity_encoding = self.kb.get_vector(kb_id)
-                    entity_encodings.append(entity_encoding)
+                    batch_kb_ids.append(kb_id)
                     keep_ents.append(eidx)
 
                 eidx += 1
-        entity_encodings = self.model.ops.asarray2f(entity_encodings, dtype="float32")
+        # One batched gather against the KB instead of one get_vector call
+        # per gold entity.
+        entity_encodings = self.model.ops.asarray2f(
+            self.kb.get_vectors(batch_kb_ids), dtype="float32"  # type: ignore[arg-type]
+        )
         selected_encodings = sentence_encodings[keep_ents]
 
         # if there are no matches, short circuit
@@ -445,6 +448,12 @@ class EntityLinker(TrainablePipe):
             return final_kb_ids
         if isinstance(docs, Doc):
             docs = [docs]
+        # The candidate generators are plain module-level functions stored on
+        # the component, so resolve them (and the KB) once for the whole batch
+        # instead of re-doing the attribute lookups per mention batch.
+        get_candidates = self.get_candidates
+        get_candidates_batch = self.get_candidates_batch
+        kb = self.kb
         for i, doc in enumerate(docs):
             if len(doc) == 0:
                 continue
@@ -461,16 +470,21 @@ class EntityLinker(TrainablePipe):
                     if ent_batch[idx].label_ not in self.labels_discard
                 ]
 
-                batch_candidates = list(
-                    self.get_candidates_batch(
-                        self.kb, [ent_batch[idx] for idx in valid_ent_idx]
-                    )
-                    if self.candidates_batch_size > 1
-                    else [
-                        self.get_candidates(self.kb, ent_batch[idx])
+                # Materialize the candidate lists up front: candidate
+                # generators may only support a single pass, and list access
+                # below is cheaper than re-driving an iterator per entity.
+                if self.candidates_batch_size > 1:
+                    batch_candidates = [
+                        list(candidates)
+                        for candidates in get_candidates_batch(
+                            kb, [ent_batch[idx] for idx in valid_ent_idx]
+                        )
+                    ]
+                else:
+                    batch_candidates = [
+                        list(get_candidates(kb, ent_batch[idx]))
                         for idx in valid_ent_idx
                     ]
-                )
 
                 # Looping through each entity in batch (TODO: rewrite)
                 for j, ent in enumerate(ent_batch):
@@ -511,14 +525,20 @@ class EntityLinker(TrainablePipe):
                         else:
                             random.shuffle(candidates)
                             # set all prior probabilities to 0 if incl_prior=False
-                            prior_probs = xp.asarray([c.prior_prob for c in candidates])
-                            if not self.incl_prior:
-                                prior_probs = xp.asarray([0.0 for _ in candidates])
+                            if self.incl_prior:
+                                prior_probs = xp.asarray(
+                                    [c.prior_prob for c in candidates], dtype="float32"
+                                )
+                            else:
+                                prior_probs = xp.zeros(
+                                    (len(candidates),), dtype="float32"
+                                )
                             scores = prior_probs
                             # add in similarity from the context
                             if self.incl_context:
                                 entity_encodings = xp.asarray(
-                                    [c.entity_vector for c in candidates]
+                                    [c.entity_vector for c in candidates],
+                                    dtype="float32",
                                 )
                                 entity_norm = xp.linalg.norm(entity_encodings, axis=1)
                                 if len(entity_encodings) != len(prior_probs):
@@ -534,7 +554,8 @@ class EntityLinker(TrainablePipe):
                                 )
                                 if sims.shape != prior_probs.shape:
                                     raise ValueError(Errors.E161)
-                                scores = prior_probs + sims - (prior_probs * sims)
+                                # p + s - p * s, with one temporary fewer
+                                scores = prior_probs + sims * (1.0 - prior_probs)
                             final_kb_ids.append(
                                 candidates[scores.argmax().item()].entity_
                                 if self.threshold is None
@@ -272,12 +272,27 @@ def test_kb_valid_entities(nlp):
     assert mykb.get_vector("Q2") == [2, 1, 0]
     assert mykb.get_vector("Q3") == [-1, -6, 5]
 
+    # test batched retrieval of entity vectors, including an unknown entity
+    assert mykb.get_vectors(["Q2", "Q342", "Q1"]) == [
+        [2, 1, 0],
+        [0, 0, 0],
+        [8, 4, 3],
+    ]
+
     # test retrieval of prior probabilities
     assert_almost_equal(mykb.get_prior_prob(entity="Q2", alias="douglas"), 0.8)
     assert_almost_equal(mykb.get_prior_prob(entity="Q3", alias="douglas"), 0.2)
     assert_almost_equal(mykb.get_prior_prob(entity="Q342", alias="douglas"), 0.0)
     assert_almost_equal(mykb.get_prior_prob(entity="Q3", alias="douglassssss"), 0.0)
 
+    # test batched retrieval of prior probabilities
+    priors = mykb.get_prior_probs(
+        entities=["Q2", "Q3", "Q342", "Q3"],
+        aliases=["douglas", "douglas", "douglas", "douglassssss"],
+    )
+    for prior, expected in zip(priors, [0.8, 0.2, 0.0, 0.0]):
+        assert_almost_equal(prior, expected)
+
 
 def test_kb_invalid_entities(nlp):
     """Test the invalid construction of a KB with an alias linked to a non-existing entity"""
@@ -465,6 +480,56 @@ def test_candidate_generation(nlp):
     assert_almost_equal(get_candidates(mykb, adam_ent)[0].prior_prob, 0.9)
 
 
+def test_candidates_sorted_by_prior(nlp):
+    """Test that candidates are returned in order of decreasing prior probability"""
+    mykb = InMemoryLookupKB(nlp.vocab, entity_vector_length=1)
+
+    # adding entities
+    mykb.add_entity(entity="Q1", freq=19, entity_vector=[1])
+    mykb.add_entity(entity="Q2", freq=5, entity_vector=[2])
+    mykb.add_entity(entity="Q3", freq=25, entity_vector=[3])
+    mykb.add_entity(entity="Q4", freq=3, entity_vector=[4])
+
+    # adding an alias with unsorted probabilities
+    mykb.add_alias(
+        alias="douglas", entities=["Q1", "Q2", "Q3"], probabilities=[0.1, 0.6, 0.2]
+    )
+    candidates = mykb.get_alias_candidates("douglas")
+    assert [c.entity_ for c in candidates] == ["Q2", "Q3", "Q1"]
+
+    # appending re-establishes the ordering
+    mykb.append_alias(alias="douglas", entity="Q4", prior_prob=0.05)
+    candidates = mykb.get_alias_candidates("douglas")
+    assert [c.entity_ for c in candidates] == ["Q2", "Q3", "Q1", "Q4"]
+
+
+def test_candidate_generation_batch(nlp):
+    """Test correct batched candidate generation, including duplicate mentions"""
+    mykb = InMemoryLookupKB(nlp.vocab, entity_vector_length=1)
+    doc = nlp("douglas adam douglas shrubbery")
+
+    # adding entities
+    mykb.add_entity(entity="Q1", freq=27, entity_vector=[1])
+    mykb.add_entity(entity="Q2", freq=12, entity_vector=[2])
+    mykb.add_entity(entity="Q3", freq=5, entity_vector=[3])
+
+    # adding aliases
+    mykb.add_alias(alias="douglas", entities=["Q2", "Q3"], probabilities=[0.8, 0.1])
+    mykb.add_alias(alias="adam", entities=["Q2"], probabilities=[0.9])
+
+    mentions = [doc[0:1], doc[1:2], doc[2:3], doc[3:4]]
+    batch_candidates = list(mykb.get_candidates_batch(mentions))
+
+    # the result is aligned with the mentions, including duplicates
+    assert len(batch_candidates) == len(mentions)
+    assert len(batch_candidates[0]) == 2
+    assert len(batch_candidates[1]) == 1
+    assert len(batch_candidates[2]) == 2
+    assert len(batch_candidates[3]) == 0
+    assert batch_candidates[1][0].entity_ == "Q2"
+    assert batch_candidates[1][0].alias_ == "adam"
+
+
 def test_el_pipe_configuration(nlp):
     """Test correct candidate generation as part of the EL pipe"""
     nlp.add_pipe("sentencizer")
@@ -71,13 +71,13 @@ def _check_kb(kb):
 
     assert candidates[0].entity_ == "Q007"
     assert 6.999 < candidates[0].entity_freq < 7.01
-    assert candidates[0].entity_vector == [0, 0, 7]
+    assert list(candidates[0].entity_vector) == [0, 0, 7]
     assert candidates[0].alias_ == "double07"
     assert 0.899 < candidates[0].prior_prob < 0.901
 
     assert candidates[1].entity_ == "Q17"
     assert 1.99 < candidates[1].entity_freq < 2.01
-    assert candidates[1].entity_vector == [7, 1, 0]
+    assert list(candidates[1].entity_vector) == [7, 1, 0]
     assert candidates[1].alias_ == "double07"
     assert 0.099 < candidates[1].prior_prob < 0.101
 
@@ -1757,18 +1757,24 @@ cdef class Doc:
             nr_char = max(len(bs) for bs in byte_strings)
         cdef np.ndarray output = numpy.zeros((len(byte_strings), nr_char), dtype='uint8')
         output.fill(255)
+        # Write through a typed memoryview and the bytes' raw buffer: element
+        # assignment on the ndarray would go through the buffer protocol for
+        # every character.
+        cdef unsigned char[:, ::1] out_view = output
+        cdef const char* chars
         cdef int i, j, start_idx, end_idx
         cdef bytes byte_string
         for i, byte_string in enumerate(byte_strings):
+            chars = byte_string
             j = 0
             start_idx = 0
             end_idx = len(byte_string) - 1
             while j < nr_char and start_idx <= end_idx:
-                output[i, j] = <unsigned char>byte_string[start_idx]
+                out_view[i, j] = <unsigned char>chars[start_idx]
                 start_idx += 1
                 j += 1
                 if j < nr_char and start_idx <= end_idx:
-                    output[i, j] = <unsigned char>byte_string[end_idx]
+                    out_view[i, j] = <unsigned char>chars[end_idx]
                     end_idx -= 1
                     j += 1
         return output